@@ -0,0 +1,54 @@
+from typing import Dict, List
+
+# Chrome DevTools Protocol helpers. Each returns False when the driver has no CDP access so
+# callers can fall back to the plain WebDriver path.
+
+
+def set_file_input_files(d, selectors: List[str], files: List[str]) -> bool:
+    """Attach files to the first matching file input with a single DOM.setFileInputFiles call."""
+    if not files or not hasattr(d, 'execute_cdp_cmd'):
+        return False
+    try:
+        root = d.execute_cdp_cmd('DOM.getDocument', {'depth': 0})['root']['nodeId']
+    except Exception:
+        return False
+    for sel in selectors:
+        try:
+            node_id = d.execute_cdp_cmd('DOM.querySelector', {'nodeId': root, 'selector': sel}).get('nodeId')
+            if node_id:
+                d.execute_cdp_cmd('DOM.setFileInputFiles', {'files': list(files), 'nodeId': node_id})
+                return True
+        except Exception:
+            continue
+    return False
+
+
+def set_cookies(d, cookies: Dict[str, str], domain: str = '.vinted.fr') -> bool:
+    """Set all cookies at the network layer in one Network.setCookies call.
+
+    Unlike WebDriver's add_cookie this does not need a same-origin document to be loaded first.
+    """
+    if not hasattr(d, 'execute_cdp_cmd'):
+        return False
+    payload = [
+        {'name': name, 'value': value, 'domain': domain, 'path': '/'}
+        for name, value in cookies.items()
+    ]
+    try:
+        d.execute_cdp_cmd('Network.enable', {})
+        d.execute_cdp_cmd('Network.setCookies', {'cookies': payload})
+        return True
+    except Exception:
+        return False
+
+
+def block_urls(d, patterns: List[str]) -> bool:
+    """Stop Chrome from fetching URLs matching the given wildcard patterns."""
+    if not hasattr(d, 'execute_cdp_cmd'):
+        return False
+    try:
+        d.execute_cdp_cmd('Network.enable', {})
+        d.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(patterns)})
+        return True
+    except Exception:
+        return False
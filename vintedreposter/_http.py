@@ -0,0 +1,29 @@
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Dict
+
+import httpx
+
+# HTTP/2 needs the optional 'h2' package (httpx[http2]); fall back to HTTP/1.1 keep-alive
+try:
+    import h2  # type: ignore  # noqa: F401
+    HTTP2_AVAILABLE = True
+except Exception:
+    HTTP2_AVAILABLE = False
+
+DEFAULT_HEADERS: Dict[str, str] = {
+    'accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36',
+}
+
+LIMITS = httpx.Limits(max_keepalive_connections=16, max_connections=32)
+
+# Shared client: CSRF fetches reuse pooled connections across calls. Its jar accepts no cookies
+# (not even from Set-Cookie), so one caller's session never leaks into the next; callers send
+# their own Cookie header per request.
+CLIENT = httpx.Client(
+    http2=HTTP2_AVAILABLE,
+    timeout=20,
+    headers=DEFAULT_HEADERS,
+    limits=LIMITS,
+    cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+)
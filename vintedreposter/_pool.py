@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+import atexit
+
+try:
+    from selenium import webdriver  # type: ignore
+except Exception:
+    webdriver = None  # type: ignore
+
+
+class BrowserPool:
+    """Keep one Chrome per profile alive for the whole run instead of launching one per item.
+
+    Reuse only pays off when one process drives several browser tasks (e.g. reposting a batch of
+    items). A caller with no more browser work should call shutdown_all() rather than leave Chrome
+    idling on about:blank until exit.
+    """
+
+    _instances: Dict[str, Any] = {}
+
+    @classmethod
+    def acquire(cls, profile: str = 'default', options_factory: Optional[Callable[[], Any]] = None):
+        drv = cls._instances.get(profile)
+        if drv is not None:
+            try:
+                # Cheap liveness probe; a closed window or dead chromedriver raises here
+                drv.current_url
+                return drv
+            except Exception:
+                cls.discard(profile)
+        if webdriver is None:
+            raise RuntimeError("Selenium is not installed.")
+        options = options_factory() if options_factory else None
+        drv = webdriver.Chrome(options=options)
+        cls._instances[profile] = drv
+        return drv
+
+    @classmethod
+    @contextmanager
+    def lease(cls, profile: str = 'default', options_factory: Optional[Callable[[], Any]] = None) -> Iterator[Any]:
+        """Yield a pooled driver and reset its state afterwards without quitting it."""
+        drv = cls.acquire(profile, options_factory)
+        try:
+            yield drv
+        finally:
+            try:
+                cls._clear_cookies(drv)
+                drv.get('about:blank')
+            except Exception:
+                cls.discard(profile)
+
+    @staticmethod
+    def _clear_cookies(drv) -> None:
+        # delete_all_cookies only reaches the current document's domain; CDP clears the whole jar
+        if hasattr(drv, 'execute_cdp_cmd'):
+            try:
+                drv.execute_cdp_cmd('Network.clearBrowserCookies', {})
+                return
+            except Exception:
+                pass
+        drv.delete_all_cookies()
+
+    @classmethod
+    def discard(cls, profile: str = 'default') -> None:
+        drv = cls._instances.pop(profile, None)
+        if drv is not None:
+            try:
+                drv.quit()
+            except Exception:
+                pass
+
+    @classmethod
+    def shutdown_all(cls) -> None:
+        for profile in list(cls._instances):
+            cls.discard(profile)
+
+
+atexit.register(BrowserPool.shutdown_all)
@@ -1,7 +1,40 @@
-from typing import Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+import hashlib
+import json
 import re
+import time
+
+from ._cdp import block_urls, set_cookies
+from ._http import CLIENT
+
+ITEMS_NEW_URL = 'https://www.vinted.fr/items/new'
 
 CSRF_REGEX = re.compile(r'\\\"CSRF_TOKEN\\\":\\\"([0-9a-f\\-]{36})\\\"', re.IGNORECASE)
+# Literal \"CSRF_TOKEN\":\" as it appears in the escaped bootstrap JSON
+_CSRF_NEEDLE = '\\"CSRF_TOKEN\\":\\"'
+_CSRF_SHAPE = re.compile(r'[0-9a-f\-]{36}', re.IGNORECASE)
+# Same match as CSRF_REGEX, run inside the page so only the token crosses the WebDriver wire
+_CSRF_IN_PAGE_JS = r"""
+const m = document.documentElement.outerHTML.match(/\\"CSRF_TOKEN\\":\\"([0-9a-f-]{36})\\"/i);
+return m ? m[1] : null;
+"""
+# Looser match for when Vinted changes the JSON escaping or token shape
+CSRF_REGEX_LAX = re.compile(r'CSRF_TOKEN["\\:]+([A-Za-z0-9\-]{32,})')
+
+# Tokens are session-stable for a while; cache them per cookie jar to skip refetching /items/new
+CSRF_TTL_SECONDS = 600.0
+_CSRF_CACHE: Dict[str, Tuple[str, float]] = {}
+
+# Optional fast HTML/JSON parsers for the bootstrap payload
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser  # type: ignore
+except Exception:
+    HTMLParser = None  # type: ignore
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
 
 # Try to import botasaurus; fall back if unavailable
 try:
@@ -14,7 +47,11 @@ except Exception:
 
 
 def _inject_cookies(d, cookies: Dict[str, str]):
-    # Add cookies before navigation
+    # One CDP call for the whole jar, usable before any navigation
+    if set_cookies(d, cookies):
+        return
+    # WebDriver fallback needs a same-domain page loaded before add_cookie
+    d.get('https://www.vinted.fr/')
     for name, value in cookies.items():
         d.add_cookie({
             'name': name,
@@ -24,29 +61,75 @@ def _inject_cookies(d, cookies: Dict[str, str]):
         })
 
 
+def _parse_bootstrap(html: str) -> Dict[str, Any]:
+    """Parse the page's embedded bootstrap JSON.
+
+    Returns an empty dict when selectolax is missing or the page has no bootstrap script.
+    """
+    if HTMLParser is None:
+        return {}
+    try:
+        tree = HTMLParser(html)
+        node = tree.css_first('script#__NEXT_DATA__') or tree.css_first('script[data-bootstrap]')
+        if node is None:
+            return {}
+        text = node.text()
+        payload = orjson.loads(text) if orjson else json.loads(text)
+    except Exception:
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def _csrf_from_bootstrap(html: str) -> Optional[str]:
+    # props.pageProps.csrfToken has not been observed on Vinted pages, which embed the token as the
+    # escaped \"CSRF_TOKEN\" string that _search_csrf tries first. It is the conventional Next.js
+    # __NEXT_DATA__ location, kept only as a fallback in case the page moves the token there.
+    page_props = (_parse_bootstrap(html).get('props') or {}).get('pageProps') or {}
+    token = page_props.get('csrfToken') if isinstance(page_props, dict) else None
+    return token if isinstance(token, str) and token else None
+
+
+def _search_csrf(html: str) -> Optional[str]:
+    # Fast path: the anchor is constant and the token is a fixed 36 chars, so str.find + slice
+    i = html.find(_CSRF_NEEDLE)
+    if i != -1:
+        start = i + len(_CSRF_NEEDLE)
+        cand = html[start:start + 36]
+        if _CSRF_SHAPE.fullmatch(cand) and html.startswith('\\"', start + 36):
+            return cand
+    token = _csrf_from_bootstrap(html)
+    if token:
+        return token
+    m = CSRF_REGEX.search(html) or CSRF_REGEX_LAX.search(html)
+    if m:
+        return m.group(1)
+    return None
+
+
 def _fetch_csrf_via_requests(cookies: Dict[str, str]) -> Optional[str]:
     try:
-        import requests
-        s = requests.Session()
-        for k, v in cookies.items():
-            s.cookies.set(k, v, domain='.vinted.fr')
-        # Use a realistic UA if present in cookies context; otherwise default
         headers = {
-            'accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36',
             'referer': 'https://www.vinted.fr/',
         }
-        r = s.get('https://www.vinted.fr/items/new', headers=headers)
+        if cookies:
+            # Per-call cookies: the shared client keeps no jar of its own
+            headers['cookie'] = '; '.join(f"{k}={v}" for k, v in cookies.items())
+        r = CLIENT.get(ITEMS_NEW_URL, headers=headers)
         r.raise_for_status()
-        html = r.text
-        m = CSRF_REGEX.search(html)
-        if m:
-            return m.group(1)
+        return _search_csrf(r.text)
     except Exception:
         return None
     return None
 
 
+# Only the HTML document is needed to read the token; skip assets and third-party trackers
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.webp', '*.gif', '*.svg',
+    '*.woff*', '*.ttf', '*.css',
+    '*google-analytics*', '*googletagmanager*', '*doubleclick*',
+    '*facebook.net*', '*hotjar*',
+]
+
 if _BOTASAURUS_AVAILABLE:
     @driver(headless=True)
     def fetch_csrf_with_browser(task) -> Optional[str]:
@@ -54,28 +137,57 @@ if _BOTASAURUS_AVAILABLE:
         cookies = ctx.get('cookies', {})
         d = task.driver
 
-        # Navigate to a same-domain page to attach cookies
-        d.get('https://www.vinted.fr/')
         _inject_cookies(d, cookies)
-        d.get('https://www.vinted.fr/items/new')
+        block_urls(d, BLOCKED_URL_PATTERNS)
+        d.get(ITEMS_NEW_URL)
 
-        html = d.page_source
-        m = CSRF_REGEX.search(html)
-        if m:
-            return m.group(1)
-        return None
+        try:
+            token = d.execute_script(_CSRF_IN_PAGE_JS)
+            if token:
+                return token
+        except Exception:
+            pass
+        return _search_csrf(d.page_source)
 else:
     fetch_csrf_with_browser = None  # type: ignore
 
 
-def extract_csrf(cookies: Dict[str, str]) -> Optional[str]:
-    """Get CSRF token either via Botasaurus (if installed) or plain requests fallback."""
+def _csrf_cache_key(cookies: Dict[str, str]) -> str:
+    ident = (cookies.get('v_uid', '') + '|' + cookies.get('access_token_web', '')).encode()
+    return hashlib.blake2b(ident, digest_size=16).hexdigest()
+
+
+def _extract_csrf_uncached(cookies: Dict[str, str]) -> Optional[str]:
+    # The token is in the server-rendered HTML, so a browser is only needed for bot challenges
+    token = _fetch_csrf_via_requests(cookies)
+    if token:
+        return token
     if fetch_csrf_with_browser:
         try:
-            token = fetch_csrf_with_browser(ctx={"cookies": cookies})
-            if token:
-                return token
+            return fetch_csrf_with_browser(ctx={"cookies": cookies})
         except Exception:
-            pass
-    # Fallback via requests
-    return _fetch_csrf_via_requests(cookies)
+            return None
+    return None
+
+
+def extract_csrf(cookies: Dict[str, str]) -> Optional[str]:
+    """Get CSRF token via plain HTTP first, escalating to Botasaurus (if installed) on failure.
+
+    Tokens are cached per session for CSRF_TTL_SECONDS; call extract_csrf.invalidate(cookies)
+    when an API call rejects the token (401/403).
+    """
+    key = _csrf_cache_key(cookies)
+    ent = _CSRF_CACHE.get(key)
+    if ent and ent[1] > time.monotonic():
+        return ent[0]
+    token = _extract_csrf_uncached(cookies)
+    if token:
+        _CSRF_CACHE[key] = (token, time.monotonic() + CSRF_TTL_SECONDS)
+    return token
+
+
+def _invalidate_csrf(cookies: Dict[str, str]) -> None:
+    _CSRF_CACHE.pop(_csrf_cache_key(cookies), None)
+
+
+extract_csrf.invalidate = _invalidate_csrf  # type: ignore[attr-defined]
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 from typing import Dict, Optional
+import threading
 import time
 import re
 
 START_URL_DEFAULT = "https://www.vinted.fr/member/signup/select_type?ref_url=https://www.vinted.fr/member/"
 WAIT_URL_PREFIX_DEFAULT = "https://www.vinted.fr/member/"
+# Profile URL: /member/<digits>, optionally followed by slug or query
+PROFILE_URL_RE = re.compile(r'^https://www\.vinted\.fr/member/\d+')
 
 # Optional backends
 try:
@@ -19,10 +22,12 @@ except Exception:
 try:
     from selenium import webdriver  # type: ignore
     from selenium.webdriver.chrome.options import Options as ChromeOptions  # type: ignore
+    from selenium.webdriver.support.ui import WebDriverWait  # type: ignore
     _SELENIUM_AVAILABLE = True
 except Exception:
     webdriver = None  # type: ignore
     ChromeOptions = None  # type: ignore
+    WebDriverWait = None  # type: ignore
     _SELENIUM_AVAILABLE = False
 
 
@@ -40,10 +45,41 @@ def _collect_cookie_dict(driver_obj) -> Dict[str, str]:
     return out
 
 
+def _watch_profile_navigation(driver_obj, event: threading.Event) -> bool:
+    """Set `event` whenever the browser navigates to a profile URL.
+
+    Uses a CDP Page.frameNavigated listener when the driver exposes add_cdp_listener;
+    returns False otherwise so the caller just polls.
+    """
+    add_listener = getattr(driver_obj, 'add_cdp_listener', None)
+    if add_listener is None or not hasattr(driver_obj, 'execute_cdp_cmd'):
+        return False
+
+    def _on_frame_navigated(message):
+        try:
+            params = message.get('params', message)
+            frame = params.get('frame') or {}
+            # Only the top frame carries the page URL; iframes have a parentId
+            if not frame.get('parentId') and PROFILE_URL_RE.match(frame.get('url') or ''):
+                event.set()
+        except Exception:
+            pass
+
+    try:
+        driver_obj.execute_cdp_cmd('Page.enable', {})
+        add_listener('Page.frameNavigated', _on_frame_navigated)
+        return True
+    except Exception:
+        return False
+
+
 def _wait_for_login_and_cookies(driver_obj, wait_url_prefix: str, timeout: int = 180) -> Dict[str, str]:
     infinite = timeout is not None and timeout <= 0
     end = None if infinite else (time.time() + timeout)
     last_url = ""
+    # Wakes the loop as soon as the profile page loads instead of at the next poll tick
+    navigated = threading.Event()
+    _watch_profile_navigation(driver_obj, navigated)
     while True:
         if end is not None and time.time() >= end:
             break
@@ -53,13 +89,14 @@ def _wait_for_login_and_cookies(driver_obj, wait_url_prefix: str, timeout: int =
             cookies = _collect_cookie_dict(driver_obj)
             # Consider logged-in only when a persistent login cookie exists
             logged_in = ('v_uid' in cookies) or ('access_token_web' in cookies)
-            # Consider profile URL when it matches /member/<digits> (optionally followed by slug or query)
-            on_profile = bool(re.match(r'^https://www\.vinted\.fr/member/\d+', cur))
+            on_profile = bool(PROFILE_URL_RE.match(cur))
             if logged_in and on_profile:
                 return cookies
         except Exception:
             pass
-        time.sleep(1.0)
+        wait = 1.0 if end is None else max(min(1.0, end - time.time()), 0.0)
+        if navigated.wait(wait):
+            navigated.clear()
     # Return whatever cookies we have, even if URL check failed
     return _collect_cookie_dict(driver_obj)
 
@@ -79,8 +116,14 @@ def login_and_get_cookies(start_url: Optional[str] = None, wait_url_prefix: str
             d.get(start_url)
             cookies = _wait_for_login_and_cookies(d, wait_url_prefix=wait_url_prefix, timeout=timeout)
             if keep_open:
-                # Wait a bit so user can see state
-                time.sleep(2)
+                # Let the profile page settle so user can see state; returns at once if already there
+                if WebDriverWait is not None:
+                    try:
+                        WebDriverWait(d, 2).until(lambda drv: PROFILE_URL_RE.match(drv.current_url))
+                    except Exception:
+                        pass
+                else:
+                    time.sleep(2)
             return cookies
 
         res = _run(ctx={})  # type: ignore
@@ -90,6 +133,8 @@ def login_and_get_cookies(start_url: Optional[str] = None, wait_url_prefix: str
         raise RuntimeError("No browser automation backend available. Install 'botasaurus' or 'selenium'.")
 
     options = ChromeOptions()
+    # Don't block on trackers/ads; the login wait loop polls URL and cookies anyway
+    options.page_load_strategy = 'eager'
     # Keep visible so user can complete login
     # options.add_argument('--headless=new')
     options.add_argument('--no-sandbox')
@@ -1,11 +1,25 @@
 from __future__ import annotations
 
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import atexit
+import functools
+import hashlib
 import os
+import shutil
 import tempfile
 import time
 
+import httpx
+
+from ._cdp import set_cookies, set_file_input_files
+from .curl_parser import split_cookies
+from ._http import DEFAULT_HEADERS, HTTP2_AVAILABLE
+from ._pool import BrowserPool
+
 
 # Try to import botasaurus and selenium; gracefully degrade if unavailable
 try:
@@ -34,6 +48,41 @@ except Exception:
     _SELENIUM_AVAILABLE = False
 
 
+Selectors = Tuple[str, ...]
+
+# Candidate selectors per form field, most specific first
+FILE_SEL = (
+    "input[type='file'][multiple]",
+    "input[type='file'][accept*='image']",
+    "input[type='file']",
+)
+TITLE_SEL = (
+    "input[name='title']",
+    "input[id*='title']",
+    "textarea[name='title']",
+    "input[placeholder*='Titre']",
+    "input[placeholder*='title' i]",
+)
+DESC_SEL = (
+    "textarea[name='description']",
+    "textarea[id*='description']",
+    "textarea[placeholder*='Description' i]",
+)
+PRICE_SEL = (
+    "input[name='price']",
+    "input[id*='price']",
+    "input[placeholder*='Prix' i]",
+    "input[aria-label*='Prix' i]",
+)
+SAVE_DRAFT_XPATHS = (
+    "//button[contains(., 'Sauvegarder le brouillon')]",
+    "//button[contains(., 'brouillon')]",
+    "//button[contains(., 'Save draft')]",
+)
+SAVE_DRAFT_CSS = "button[type='submit']"
+SAVE_CONFIRM_SEL = "[data-testid*='toast'], .Toast, [role='status']"
+
+
 @dataclass
 class RepostItemData:
     item_id: int
@@ -51,8 +100,24 @@ class RepostItemData:
 
 
 def _inject_cookies(d, cookies: Dict[str, str], headers: Optional[Dict[str, str]] = None):
-    # Add cookies before navigation
-    for name, value in cookies.items():
+    all_cookies = dict(cookies)
+    # Also parse Cookie header if provided
+    if headers:
+        cookie_str = None
+        for k, v in headers.items():
+            if k.lower() == 'cookie':
+                cookie_str = v
+                break
+        if cookie_str:
+            parsed: Dict[str, str] = {}
+            split_cookies(cookie_str, parsed)
+            all_cookies.update((name, val) for name, val in parsed.items() if name and val)
+    # One CDP call for the whole jar, usable before any navigation
+    if set_cookies(d, all_cookies):
+        return
+    # WebDriver fallback needs a same-domain page loaded before add_cookie
+    d.get('https://www.vinted.fr/')
+    for name, value in all_cookies.items():
         try:
             d.add_cookie({
                 'name': name,
@@ -63,73 +128,199 @@ def _inject_cookies(d, cookies: Dict[str, str], headers: Optional[Dict[str, str]
         except Exception:
             # Some cookies cannot be set (httpOnly, sameSite); ignore failures
             pass
-    # Also parse Cookie header if provided
-    if headers:
-        cookie_str = None
-        for k, v in headers.items():
-            if k.lower() == 'cookie':
-                cookie_str = v
-                break
-        if cookie_str:
-            for part in cookie_str.split(';'):
-                if '=' in part:
-                    name, val = part.split('=', 1)
-                    name = name.strip()
-                    val = val.strip()
-                    if name and val:
-                        try:
-                            d.add_cookie({
-                                'name': name,
-                                'value': val,
-                                'domain': '.vinted.fr',
-                                'path': '/',
-                            })
-                        except Exception:
-                            pass
 
 
 def _first(elist):
     return elist[0] if elist else None
 
 
+_EXT_BY_CONTENT_TYPE = {
+    'image/png': '.png',
+    'image/jpeg': '.jpg',
+    'image/webp': '.webp',
+}
+
+# Peak memory per download is one chunk rather than the whole image body
+_DOWNLOAD_CHUNK = 1 << 16
+
+
+def _ext_from_ct(ct: str) -> str:
+    return _EXT_BY_CONTENT_TYPE.get(ct.split(';')[0].strip().lower(), '.jpg')
+
+
+# Opt-in: when VINTED_PHOTO_CACHE names a directory, downloaded photos are kept there across runs
+# (keyed by URL) so reposting the same item skips the network. Off by default, nothing is kept.
+PHOTO_CACHE_DIR: Optional[str] = os.path.expanduser(os.environ['VINTED_PHOTO_CACHE']) if os.environ.get('VINTED_PHOTO_CACHE') else None
+PHOTO_CACHE_MAX_FILES = 500
+
+
+def _photo_cache_key(url: str) -> str:
+    return hashlib.sha1(url.encode()).hexdigest()
+
+
+def _cached_photo(key: str) -> Optional[str]:
+    if PHOTO_CACHE_DIR is None:
+        return None
+    for ext in set(_EXT_BY_CONTENT_TYPE.values()):
+        path = os.path.join(PHOTO_CACHE_DIR, key + ext)
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def _link_photo(src: str, temp_dir: str, idx: int) -> str:
+    path = os.path.join(temp_dir, f"photo_{idx+1}{os.path.splitext(src)[1]}")
+    try:
+        os.symlink(src, path)
+    except OSError:
+        # Symlinks may be unavailable (e.g. Windows without privileges)
+        shutil.copyfile(src, path)
+    return path
+
+
+def _prune_photo_cache(max_files: int = PHOTO_CACHE_MAX_FILES) -> None:
+    """Drop least recently used cache entries (by mtime) beyond max_files."""
+    if PHOTO_CACHE_DIR is None:
+        return
+    try:
+        entries = [e for e in os.scandir(PHOTO_CACHE_DIR) if e.is_file(follow_symlinks=False)]
+    except OSError:
+        return
+    if len(entries) <= max_files:
+        return
+    entries.sort(key=lambda e: e.stat().st_mtime)
+    for e in entries[:len(entries) - max_files]:
+        try:
+            os.remove(e.path)
+        except OSError:
+            pass
+
+
+async def _adownload(client, url: str, idx: int, temp_dir: str) -> str:
+    key = _photo_cache_key(url)
+    cached = _cached_photo(key)
+    if cached:
+        try:
+            # Refresh mtime so pruning evicts least recently used photos first
+            os.utime(cached)
+        except OSError:
+            pass
+        return _link_photo(cached, temp_dir, idx)
+    target_dir = None
+    if PHOTO_CACHE_DIR is not None:
+        try:
+            os.makedirs(PHOTO_CACHE_DIR, exist_ok=True)
+            target_dir = PHOTO_CACHE_DIR
+        except OSError:
+            pass
+    async with client.stream('GET', url) as r:
+        r.raise_for_status()
+        ext = _ext_from_ct(r.headers.get('content-type', ''))
+        if target_dir is None:
+            path = os.path.join(temp_dir, f"photo_{idx+1}{ext}")
+        else:
+            path = os.path.join(target_dir, key + ext)
+        # Write to a private name and rename, so a failed download never leaves a partial cache entry
+        part = f"{path}.{os.getpid()}.{idx}.part"
+        try:
+            with open(part, 'wb') as f:
+                async for chunk in r.aiter_bytes(_DOWNLOAD_CHUNK):
+                    f.write(chunk)
+            os.replace(part, path)
+        except BaseException:
+            try:
+                os.remove(part)
+            except OSError:
+                pass
+            raise
+    if target_dir is None:
+        return path
+    return _link_photo(path, temp_dir, idx)
+
+
+async def _adownload_all(photo_urls: List[str], headers: Optional[Dict[str, str]], cookies: Optional[Dict[str, str]], temp_dir: str) -> List[Any]:
+    jar = httpx.Cookies()
+    for k, v in (cookies or {}).items():
+        jar.set(k, v, domain='.vinted.fr')
+    req_headers = {**DEFAULT_HEADERS, **{k: v for k, v in (headers or {}).items() if k.lower() not in {'cookie'}}}
+    async with httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=20,
+        headers=req_headers,
+        cookies=jar,
+        limits=httpx.Limits(max_connections=8),
+    ) as client:
+        return await asyncio.gather(
+            *[_adownload(client, u, i, temp_dir) for i, u in enumerate(photo_urls)],
+            return_exceptions=True,
+        )
+
+
+# Background photo downloads overlap with browser navigation in _run_repost_flow
+_DOWNLOAD_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="vinted_photos")
+PHOTO_DOWNLOAD_TIMEOUT = 60
+
+
+def _photo_temp_dir() -> str:
+    # Photos are written once and read back by the browser; keep them on tmpfs when available
+    if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+        try:
+            return tempfile.mkdtemp(prefix="vinted_photos_", dir='/dev/shm')
+        except Exception:
+            pass
+    return tempfile.mkdtemp(prefix="vinted_photos_")
+
+
 def _download_photos(photo_urls: List[str], headers: Optional[Dict[str, str]] = None, cookies: Optional[Dict[str, str]] = None) -> List[str]:
-    """Download photo URLs to a temp folder; return absolute file paths."""
+    """Download photo URLs concurrently to a temp folder; return absolute file paths in input order."""
     if not photo_urls:
         return []
+    temp_dir = _photo_temp_dir()
     try:
-        import requests
+        results = asyncio.run(_adownload_all(photo_urls, headers, cookies, temp_dir))
     except Exception:
+        shutil.rmtree(temp_dir, ignore_errors=True)
         return []
-    out_files: List[str] = []
-    temp_dir = tempfile.mkdtemp(prefix="vinted_photos_")
-    s = requests.Session()
-    if cookies:
-        for k, v in cookies.items():
-            try:
-                s.cookies.set(k, v, domain='.vinted.fr')
-            except Exception:
-                pass
-    if headers:
-        s.headers.update({k: v for k, v in headers.items() if k.lower() not in {'cookie'}})
-    for i, url in enumerate(photo_urls):
-        try:
-            r = s.get(url, timeout=20)
-            r.raise_for_status()
-            ext = '.jpg'
-            ct = r.headers.get('content-type', '')
-            if 'png' in ct:
-                ext = '.png'
-            elif 'jpeg' in ct:
-                ext = '.jpg'
-            elif 'webp' in ct:
-                ext = '.webp'
-            path = os.path.join(temp_dir, f"photo_{i+1}{ext}")
-            with open(path, 'wb') as f:
-                f.write(r.content)
-            out_files.append(path)
-        except Exception:
-            continue
-    return out_files
+    _prune_photo_cache()
+    # Failed downloads come back as exceptions; skip them like the serial loop did
+    files = [r for r in results if isinstance(r, str)]
+    if not files:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return files
+
+
+def _release_photo_files(files: List[str]) -> None:
+    """Remove the per-item temp dirs once the browser is done with the files.
+
+    Staging dirs may live on tmpfs (RAM). Cached originals are untouched since the dirs hold symlinks.
+    """
+    for d in {os.path.dirname(f) for f in files}:
+        shutil.rmtree(d, ignore_errors=True)
+
+
+# Staged files whose save was not confirmed; released once the driver lease ends (or at exit)
+_PENDING_RELEASE: List[str] = []
+
+
+def _release_pending() -> None:
+    files = list(_PENDING_RELEASE)
+    _PENDING_RELEASE.clear()
+    _release_photo_files(files)
+
+
+atexit.register(_release_pending)
+
+
+def _release_when_done(future) -> None:
+    """Release the files of a download the caller stopped waiting for, once it finishes."""
+    if future.cancel():
+        return
+    future.add_done_callback(lambda f: None if f.cancelled() or f.exception() else _release_photo_files(f.result()))
+
+
+# Photo URL keys in order of preference, then preferred sizes inside 'formats'
+_PHOTO_URL_KEYS = ('full_size_url', 'url', 'image_url', 'original_url', 'original')
+_PHOTO_FORMAT_PREF = ('xxl', 'xl', 'l', 'm', 'original')
 
 
 def _extract_photo_urls(item: Dict[str, Any]) -> List[str]:
@@ -137,25 +328,24 @@ def _extract_photo_urls(item: Dict[str, Any]) -> List[str]:
     photos = item.get('photos') or item.get('item_photos') or []
     if isinstance(photos, list):
         for p in photos:
-            # Try a range of common keys
-            u = (
-                p.get('full_size_url') or p.get('url') or p.get('image_url') or p.get('original_url') or p.get('original')
-            )
-            if not u and isinstance(p.get('formats'), dict):
+            if not isinstance(p, dict):
+                continue
+            u = next((p[k] for k in _PHOTO_URL_KEYS if isinstance(p.get(k), str) and p[k]), None)
+            if not u:
                 # Pick a large format if present
                 fmts = p.get('formats')
-                for key in ['xxl', 'xl', 'l', 'm', 'original']:
-                    if key in fmts and isinstance(fmts[key], dict):
-                        u = fmts[key].get('url')
-                        if u:
-                            break
-            if isinstance(u, str):
+                if isinstance(fmts, dict):
+                    u = next((fmts[k]['url'] for k in _PHOTO_FORMAT_PREF
+                              if isinstance(fmts.get(k), dict) and isinstance(fmts[k].get('url'), str) and fmts[k]['url']), None)
+            if u:
                 urls.append(u)
-    return urls
+    # The same image can be listed more than once; keep the first occurrence only
+    return list(dict.fromkeys(urls))
 
 
 def collect_item_data(base_item: Dict[str, Any], detailed_item: Optional[Dict[str, Any]] = None) -> RepostItemData:
-    src: Dict[str, Any] = {**(base_item or {}), **(detailed_item or {})}
+    # Read-only view over both dicts (details take precedence) without copying them
+    src = ChainMap(detailed_item or {}, base_item or {})
     # Price + currency
     amount = src.get('price_numeric')
     currency = src.get('price_currency') or src.get('currency')
@@ -188,20 +378,77 @@ def collect_item_data(base_item: Dict[str, Any], detailed_item: Optional[Dict[st
     )
 
 
-def _find_first(driver, selectors: List[str]):
+# Selector that matched last, keyed by (WebDriver session id, selector tuple). Only the
+# selector string is kept: WebElements go stale across navigations.
+_WINNING_SELECTORS: Dict[Tuple[Optional[str], Selectors], str] = {}
+
+# Probe every selector in-page so a lookup costs one WebDriver roundtrip instead of one per selector
+_FIND_FIRST_JS = """
+const sels = arguments[0];
+for (let i = 0; i < sels.length; i++) {
+    let e = null;
+    try { e = document.querySelector(sels[i]); } catch (err) { continue; }
+    if (e) return [e, i];
+}
+return null;
+"""
+
+_FIND_SAVE_DRAFT_JS = """
+for (const xp of arguments[0]) {
+    const r = document.evaluate(xp, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null);
+    if (r.singleNodeValue) return r.singleNodeValue;
+}
+return document.querySelector(arguments[1]);
+"""
+
+
+def _find_first_js(driver, selectors: Selectors) -> Tuple[Any, Optional[str]]:
+    """Return (element, winning selector) using a single execute_script call."""
+    res = driver.execute_script(_FIND_FIRST_JS, list(selectors))
+    if res:
+        return res[0], selectors[int(res[1])]
+    return None, None
+
+
+@functools.lru_cache(maxsize=64)
+def _probe_order(selectors: Selectors, best: Optional[str]) -> Selectors:
+    if not best or best not in selectors:
+        return selectors
+    return (best,) + tuple(s for s in selectors if s != best)
+
+
+def _prefer_winner(driver, selectors: Selectors) -> Selectors:
+    return _probe_order(selectors, _WINNING_SELECTORS.get((getattr(driver, 'session_id', None), selectors)))
+
+
+def _remember_winner(driver, selectors: Selectors, sel: str) -> None:
+    _WINNING_SELECTORS[(getattr(driver, 'session_id', None), selectors)] = sel
+
+
+def _find_first(driver, selectors: Selectors):
+    ordered = _prefer_winner(driver, selectors)
+    try:
+        el, sel = _find_first_js(driver, ordered)
+        if el is not None and sel:
+            _remember_winner(driver, selectors, sel)
+        return el
+    except Exception:
+        # execute_script unavailable or failed; probe selectors one by one
+        pass
     if not By:
         return None
-    for sel in selectors:
+    for sel in ordered:
         try:
             el = driver.find_element(By.CSS_SELECTOR, sel)
             if el:
+                _remember_winner(driver, selectors, sel)
                 return el
         except Exception:
             continue
     return None
 
 
-def _type_value(driver, selectors: List[str], value: str) -> bool:
+def _type_value(driver, selectors: Selectors, value: str) -> bool:
     el = _find_first(driver, selectors)
     if not el:
         return False
@@ -216,9 +463,12 @@ def _type_value(driver, selectors: List[str], value: str) -> bool:
         return False
 
 
-def _upload_files(driver, selectors: List[str], files: List[str]) -> bool:
+def _upload_files(driver, selectors: Selectors, files: List[str]) -> bool:
     if not files:
         return False
+    # One CDP call attaches every file instead of pushing the joined paths through send_keys
+    if set_file_input_files(driver, list(_prefer_winner(driver, selectors)), files):
+        return True
     el = _find_first(driver, selectors)
     if not el:
         return False
@@ -230,15 +480,62 @@ def _upload_files(driver, selectors: List[str], files: List[str]) -> bool:
         return False
 
 
+# Set several fields in one roundtrip. The native value setter is used so React-controlled
+# inputs register the change, then input/change events are dispatched. Returns one flag per field.
+_FILL_FIELDS_JS = """
+const sels = arguments[0];
+const vals = arguments[1];
+const done = [];
+for (let i = 0; i < sels.length; i++) {
+    done.push(false);
+    if (vals[i] === null) continue;
+    for (const s of sels[i]) {
+        let e = null;
+        try { e = document.querySelector(s); } catch (err) { continue; }
+        if (!e) continue;
+        const desc = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(e), 'value');
+        if (desc && desc.set) { desc.set.call(e, vals[i]); } else { e.value = vals[i]; }
+        e.dispatchEvent(new Event('input', {bubbles: true}));
+        e.dispatchEvent(new Event('change', {bubbles: true}));
+        done[i] = true;
+        break;
+    }
+}
+return done;
+"""
+
+
+def _fill_fields(driver, fields: List[Tuple[Selectors, Optional[str]]]) -> None:
+    """Fill (selectors, value) pairs in one execute_script call; None values are skipped.
+
+    Fields the script could not fill fall back to _type_value (find + clear + send_keys).
+    """
+    try:
+        done = driver.execute_script(
+            _FILL_FIELDS_JS,
+            [list(_prefer_winner(driver, sels)) for sels, _ in fields],
+            [val for _, val in fields],
+        )
+    except Exception:
+        done = None
+    if not isinstance(done, list) or len(done) != len(fields):
+        done = [False] * len(fields)
+    for (sels, val), ok in zip(fields, done):
+        if val is not None and not ok:
+            _type_value(driver, sels, val)
+
+
 def _click_save_draft(driver) -> bool:
+    try:
+        btn = driver.execute_script(_FIND_SAVE_DRAFT_JS, list(SAVE_DRAFT_XPATHS), SAVE_DRAFT_CSS)
+        if btn:
+            btn.click()
+            return True
+    except Exception:
+        pass
     if not By:
         return False
-    candidates = [
-        (By.XPATH, "//button[contains(., 'Sauvegarder le brouillon')]") ,
-        (By.XPATH, "//button[contains(., 'brouillon')]") ,
-        (By.XPATH, "//button[contains(., 'Save draft')]") ,
-        (By.CSS_SELECTOR, "button[type='submit']"),
-    ]
+    candidates = [(By.XPATH, xp) for xp in SAVE_DRAFT_XPATHS] + [(By.CSS_SELECTOR, SAVE_DRAFT_CSS)]
     for by, sel in candidates:
         try:
             btn = driver.find_element(by, sel)
@@ -250,9 +547,39 @@ def _click_save_draft(driver) -> bool:
     return False
 
 
+def _count_confirmations(driver_obj) -> int:
+    if not By:
+        return 0
+    try:
+        return len(driver_obj.find_elements(By.CSS_SELECTOR, SAVE_CONFIRM_SEL))
+    except Exception:
+        return 0
+
+
+def _wait_for_save(driver_obj, pre_url: str, pre_confirmations: int, timeout: float = 10) -> bool:
+    """Wait until the save navigates away or a new confirmation toast appears, up to timeout.
+
+    role="status" live regions are often mounted permanently, so only a count above the one taken
+    before the click counts as a confirmation. Returns whether the save was confirmed.
+    """
+    if not (WebDriverWait and By):
+        time.sleep(3)
+        return False
+    try:
+        WebDriverWait(driver_obj, timeout).until(
+            lambda d: d.current_url != pre_url or _count_confirmations(d) > pre_confirmations
+        )
+        return True
+    except Exception:
+        return False
+
+
 def _run_repost_flow(driver_obj, cookies: Dict[str, str], headers: Dict[str, str], data: RepostItemData) -> Dict[str, Any]:
-    # Navigate and attach cookies
-    driver_obj.get('https://www.vinted.fr/')
+    # Download photos in the background while the browser loads the form.
+    # All driver_obj calls stay on this thread.
+    photos_future = _DOWNLOAD_POOL.submit(_download_photos, data.photo_urls, headers, cookies)
+
+    # Attach cookies, then navigate
     _inject_cookies(driver_obj, cookies, headers)
     driver_obj.get('https://www.vinted.fr/items/new')
 
@@ -266,39 +593,31 @@ def _run_repost_flow(driver_obj, cookies: Dict[str, str], headers: Dict[str, str
         pass
 
     # Upload photos first so they start processing
-    files = _download_photos(data.photo_urls, headers=headers, cookies=cookies)
-    _upload_files(driver_obj, [
-        "input[type='file'][multiple]",
-        "input[type='file'][accept*='image']",
-        "input[type='file']",
-    ], files)
+    try:
+        files = photos_future.result(timeout=PHOTO_DOWNLOAD_TIMEOUT)
+    except Exception:
+        # Timed out: the download keeps running in the pool, so clean up its dir when it lands
+        _release_when_done(photos_future)
+        files = []
+    _upload_files(driver_obj, FILE_SEL, files)
 
     # Fill title, description, and price
-    _type_value(driver_obj, [
-        "input[name='title']",
-        "input[id*='title']",
-        "textarea[name='title']",
-        "input[placeholder*='Titre']",
-        "input[placeholder*='title' i]",
-    ], data.title)
-
-    _type_value(driver_obj, [
-        "textarea[name='description']",
-        "textarea[id*='description']",
-        "textarea[placeholder*='Description' i]",
-    ], data.description)
-
-    if data.price is not None:
-        _type_value(driver_obj, [
-            "input[name='price']",
-            "input[id*='price']",
-            "input[placeholder*='Prix' i]",
-            "input[aria-label*='Prix' i]",
-        ], str(data.price))
-
-    # Try to click Save draft
+    _fill_fields(driver_obj, [
+        (TITLE_SEL, data.title),
+        (DESC_SEL, data.description),
+        (PRICE_SEL, str(data.price) if data.price is not None else None),
+    ])
+
+    # Try to click Save draft, then return as soon as the page reacts
+    pre_url = getattr(driver_obj, 'current_url', '')
+    pre_confirmations = _count_confirmations(driver_obj)
     saved = _click_save_draft(driver_obj)
-    time.sleep(3)
+    confirmed = saved and _wait_for_save(driver_obj, pre_url, pre_confirmations)
+    if confirmed:
+        _release_photo_files(files)
+    else:
+        # Chrome may still be reading or uploading the attached files; keep them until the driver is done
+        _PENDING_RELEASE.extend(files)
 
     return {
         "ok": bool(saved),
@@ -308,19 +627,36 @@ def _run_repost_flow(driver_obj, cookies: Dict[str, str], headers: Dict[str, str
     }
 
 
+def _repost_task(task) -> Dict[str, Any]:
+    ctx = task.ctx
+    cookies: Dict[str, str] = ctx.get('cookies', {})
+    headers: Dict[str, str] = ctx.get('headers', {})
+    data: RepostItemData = ctx.get('data')
+    d = task.driver
+    return _run_repost_flow(d, cookies, headers, data)
+
+
 if _BOTASAURUS_AVAILABLE:
-    @driver(headless=False)
-    def _repost_with_browser(task) -> Dict[str, Any]:
-        ctx = task.ctx
-        cookies: Dict[str, str] = ctx.get('cookies', {})
-        headers: Dict[str, str] = ctx.get('headers', {})
-        data: RepostItemData = ctx.get('data')
-        d = task.driver
-        return _run_repost_flow(d, cookies, headers, data)
+    # Keep the Botasaurus browser alive between items where the installed version supports it
+    try:
+        _repost_with_browser = driver(headless=False, reuse_driver=True)(_repost_task)
+    except TypeError:
+        _repost_with_browser = driver(headless=False)(_repost_task)
 else:
     _repost_with_browser = None  # type: ignore
 
 
+def _chrome_options():
+    options = ChromeOptions()
+    # Return from driver.get() at DOMContentLoaded; WebDriverWait guards the elements we need
+    options.page_load_strategy = 'eager'
+    # Keep visible for now to help diagnose; switch to headless if desired
+    # options.add_argument('--headless=new')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    return options
+
+
 def create_draft_via_browser(cookies: Dict[str, str], headers: Dict[str, str], base_item: Dict[str, Any], detailed_item: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """High-level API to run the browser repost flow. Returns a dict with result info."""
     data = collect_item_data(base_item, detailed_item)
@@ -337,16 +673,10 @@ def create_draft_via_browser(cookies: Dict[str, str], headers: Dict[str, str], b
     if not _SELENIUM_AVAILABLE or webdriver is None:
         raise RuntimeError("No browser automation backend available. Install 'botasaurus' or 'selenium'.")
 
-    options = ChromeOptions()
-    # Keep visible for now to help diagnose; switch to headless if desired
-    # options.add_argument('--headless=new')
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
-    driver_obj = webdriver.Chrome(options=options)
+    # Reuse one pooled Chrome across items; it is only quit at process exit
     try:
-        return _run_repost_flow(driver_obj, cookies, headers, data)
+        with BrowserPool.lease(options_factory=_chrome_options) as driver_obj:
+            return _run_repost_flow(driver_obj, cookies, headers, data)
     finally:
-        try:
-            driver_obj.quit()
-        except Exception:
-            pass
+        # The lease has navigated away, so Chrome no longer needs any staged files
+        _release_pending()
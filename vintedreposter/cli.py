@@ -1,21 +1,25 @@
 import argparse
+import asyncio
 import json
 import sys
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timezone
 
 from rich import print
 from rich.table import Table
 
 from .curl_parser import parse_curl
-from .vinted import VintedClient
+from .vinted import AsyncVintedClient, VintedClient
 from .browser_csrf import extract_csrf
 from .browser_reposter import create_draft_via_browser
 from .browser_login import login_and_get_cookies
-import os
-import tempfile
+from ._pool import BrowserPool
+import httpx
 import uuid
 
+# Numeric JSON values (timestamps, prices)
+_NUM = (int, float)
+
 
 def _extract_price_currency(item: Dict[str, Any]):
     # Try price_numeric first
@@ -26,18 +30,40 @@ def _extract_price_currency(item: Dict[str, Any]):
         if isinstance(p, dict):
             amount = p.get('amount')
             currency = currency or p.get('currency_code')
-        elif isinstance(p, (int, float)):
+        elif isinstance(p, _NUM):
             amount = p
         elif isinstance(p, str):
             amount = p
     return amount, currency
 
 
+# Values derived once per item for sorting and rendering, keyed by Vinted item id. Kept off the
+# API dicts themselves so they never end up in payloads built from those items.
+_DERIVED: Dict[Any, Dict[str, Any]] = {}
+
+
+def _derived(item: Dict[str, Any]) -> Dict[str, Any]:
+    key = item.get('id')
+    # Without an id there is nothing stable to key on; hand back a throwaway entry
+    return {} if key is None else _DERIVED.setdefault(key, {})
+
+
 def _parse_created_at(item: Dict[str, Any]) -> Optional[datetime]:
-    """Try to extract a timezone-aware datetime for item creation."""
+    """Try to extract a timezone-aware datetime for item creation (memoized per item id)."""
+    entry = _derived(item)
+    if 'dt' not in entry:
+        entry['dt'] = _created_at_from_fields(item)
+    return entry['dt']
+
+
+def _forget_created_at(item: Dict[str, Any]) -> None:
+    _derived(item).pop('dt', None)
+
+
+def _created_at_from_fields(item: Dict[str, Any]) -> Optional[datetime]:
     # Prefer created_at_ts if trustworthy
     ts = item.get('created_at_ts')
-    if isinstance(ts, (int, float)):
+    if isinstance(ts, _NUM):
         # Heuristic: ms vs s
         sec = ts / 1000.0 if ts > 10_000_000_000 else ts
         try:
@@ -63,16 +89,14 @@ def _parse_created_at(item: Dict[str, Any]) -> Optional[datetime]:
     # Fallback: derive from earliest photo high_resolution.timestamp
     photos = item.get('photos')
     if isinstance(photos, list) and photos:
-        best_ts = None
-        for p in photos:
-            if not isinstance(p, dict):
-                continue
-            hr = p.get('high_resolution') or {}
-            pts = hr.get('timestamp')
-            if isinstance(pts, (int, float)):
-                if best_ts is None or pts < best_ts:
-                    best_ts = pts
-        if isinstance(best_ts, (int, float)):
+        best_ts = min(
+            (
+                hr['timestamp'] for hr in (p.get('high_resolution') for p in photos if isinstance(p, dict))
+                if isinstance(hr, dict) and isinstance(hr.get('timestamp'), _NUM)
+            ),
+            default=None,
+        )
+        if best_ts is not None:
             try:
                 return datetime.fromtimestamp(best_ts, tz=timezone.utc)
             except Exception:
@@ -80,6 +104,134 @@ def _parse_created_at(item: Dict[str, Any]) -> Optional[datetime]:
     return None
 
 
+_STAT_KEYS = ("favorite_count", "favourite_count", "view_count", "views")
+_CREATED_KEYS = ("created_at", "created_at_ts")
+# Bounded so detail fetches don't trip Vinted's rate limiting (429)
+ENRICH_CONCURRENCY = 8
+
+
+async def _enrich_one(acli: AsyncVintedClient, sem: asyncio.Semaphore, it: Dict[str, Any], csrf: Callable[[], Awaitable[Optional[str]]]) -> Dict[str, Any]:
+    """Fill missing stats/created date on one wardrobe item from the item and editor endpoints.
+
+    csrf is awaited only if the editor endpoint is actually needed.
+    """
+    try:
+        item_id = int(it.get('id'))
+    except Exception:
+        return it
+    need_stats = not any(k in it for k in _STAT_KEYS)
+    need_created = not any(k in it for k in _CREATED_KEYS)
+    async with sem:
+        if need_stats or need_created:
+            try:
+                det = await acli.get_item(item_id)
+                if isinstance(det, dict):
+                    # Merge non-empty stats into the item
+                    for k in _STAT_KEYS + _CREATED_KEYS:
+                        if det.get(k) is not None:
+                            it[k] = det.get(k)
+            except Exception:
+                pass
+    # If still missing created date, try editor details (requires CSRF). The editor payload is
+    # heavy, so skip it whenever a date can already be derived (e.g. from photo timestamps);
+    # the parsed value stays memoized on the item for sorting.
+    if any(k in it for k in _CREATED_KEYS) or _parse_created_at(it) is not None:
+        return it
+    # Drop the memoized miss so the merged editor fields get parsed later
+    _forget_created_at(it)
+    # Awaited outside the semaphore so a slow token fetch does not hold a request slot
+    csrf_list = await csrf()
+    if csrf_list:
+        async with sem:
+            try:
+                ed = await acli.get_item_upload_details(item_id, csrf_list)
+                if isinstance(ed, dict):
+                    # Prefer nested item.created_at
+                    created_nested = (ed.get('item') or {}).get('created_at')
+                    if created_nested and 'created_at' not in it:
+                        it['created_at'] = created_nested
+                    if 'created_at_ts' in ed and ed.get('created_at_ts') is not None:
+                        it['created_at_ts'] = ed.get('created_at_ts')
+            except Exception:
+                pass
+    return it
+
+
+def _csrf_or_none(cookies: Dict[str, str]) -> Optional[str]:
+    try:
+        return extract_csrf(cookies)
+    except Exception:
+        return None
+
+
+async def _load_items(client: VintedClient, user_id: int, per_page: int, cookies: Dict[str, str]) -> List[Dict[str, Any]]:
+    """Fetch all wardrobe pages and enrich them on one event loop and connection pool.
+
+    The CSRF token for the editor endpoint is extracted in a worker thread (it may drive a
+    browser), started only once the first item turns out to need it; other items keep enriching
+    meanwhile. Items are returned in wardrobe order.
+    """
+    csrf_task: Optional[asyncio.Task] = None
+
+    async def csrf() -> Optional[str]:
+        nonlocal csrf_task
+        if csrf_task is None:
+            csrf_task = asyncio.create_task(asyncio.to_thread(_csrf_or_none, cookies))
+        return await csrf_task
+
+    async with AsyncVintedClient(client) as acli:
+        items = await acli.wardrobe_items_all(user_id, per_page=per_page, order="relevance")
+        sem = asyncio.Semaphore(ENRICH_CONCURRENCY)
+        return await asyncio.gather(*[_enrich_one(acli, sem, it, csrf) for it in items])
+
+
+# Photo re-hosting: parallel downloads, with fewer concurrent uploads to respect anti-abuse limits
+PHOTO_WORKERS = 6
+PHOTO_UPLOAD_CONCURRENCY = 3
+
+
+def _extract_photo_url(p: Any) -> Optional[str]:
+    if not isinstance(p, dict):
+        return None
+    return p.get('full_size_url') or p.get('url') or p.get('image_url') or (
+        isinstance(p.get('formats'), dict) and next((v.get('url') for k, v in p['formats'].items() if isinstance(v, dict) and v.get('url')), None)
+    )
+
+
+async def _rehost_photos(client: VintedClient, csrf: str, photos: List[Any], upload_temp_uuid: str) -> List[Dict[str, Any]]:
+    """Download each source photo and re-upload it under upload_temp_uuid, keeping the original order."""
+    downloads = asyncio.Semaphore(PHOTO_WORKERS)
+    upload_slots = asyncio.Semaphore(PHOTO_UPLOAD_CONCURRENCY)
+
+    async def _rehost(acli: AsyncVintedClient, i: int, p: Any) -> Optional[Dict[str, Any]]:
+        u = _extract_photo_url(p)
+        if not u:
+            return None
+        try:
+            fname = f"img_{i+1}.jpg"
+            async with downloads:
+                content = await acli.fetch_bytes(u)
+            try:
+                async with upload_slots:
+                    up = await acli.upload_photo_bytes(csrf, content, fname, upload_temp_uuid, photo_type='item')
+            except httpx.HTTPStatusError as e2:
+                print(f"[yellow]Upload attempt failed for {fname}: {e2} {e2.response.text}[/yellow]")
+                return None
+            except Exception as e2:
+                print(f"[yellow]Upload attempt failed for {fname}: {e2}[/yellow]")
+                return None
+            pid = up.get('id')
+            if pid:
+                return {"id": pid, "orientation": up.get('orientation') or 0}
+        except Exception as e:
+            print(f"[yellow]Photo upload failed for {u}: {e}[/yellow]")
+        return None
+
+    async with AsyncVintedClient(client, max_connections=PHOTO_WORKERS) as acli:
+        rehosted = await asyncio.gather(*[_rehost(acli, i, p) for i, p in enumerate(photos)])
+    return [r for r in rehosted if r]
+
+
 def _days_since_created(item: Dict[str, Any]) -> str:
     dt = _parse_created_at(item)
     if not dt:
@@ -91,7 +243,52 @@ def _days_since_created(item: Dict[str, Any]) -> str:
     return str(days)
 
 
-def render_items_table(items: List[Dict[str, Any]]):
+# Alternative spellings seen across Vinted endpoints, in order of preference
+_FAV_KEYS = ('favorite_count', 'favourite_count', 'favorites_count', 'favourites_count')
+_VIEW_KEYS = ('view_count', 'views')
+
+
+def _display_fields(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Resolve favs/views/price/created date once per item for rendering."""
+    entry = _derived(item)
+    if 'price' not in entry:
+        entry['favs'] = next((item[k] for k in _FAV_KEYS if item.get(k)), 0)
+        entry['views'] = next((item[k] for k in _VIEW_KEYS if item.get(k)), 0)
+        entry['price'] = _extract_price_currency(item)
+        _parse_created_at(item)
+    return entry
+
+
+_TABLE_HEADERS = ("#", "ID", "Title", "Price", "Days", "Favs", "Views")
+# Columns right-aligned in both the Rich and the plain renderer
+_RIGHT_ALIGNED = {0, 3, 4, 5, 6}
+
+
+def _row_cells(idx: int, it: Dict[str, Any]) -> Tuple[str, ...]:
+    shown = _display_fields(it)
+    amount, curr = shown['price']
+    price = f"{amount} {curr}".strip() if amount is not None else ""
+    title = it.get('title') or it.get('brand_title') or ''
+    days = _days_since_created(it)
+    return (str(idx), str(it.get('id')), str(title), str(price), str(days), str(shown['favs']), str(shown['views']))
+
+
+def render_items_plain(items: List[Dict[str, Any]]):
+    """Render the items table as preformatted text in a single write; much cheaper than Rich for large lists."""
+    rows = [_TABLE_HEADERS] + [_row_cells(idx, it) for idx, it in enumerate(items, 1)]
+    widths = [max(len(r[c]) for r in rows) for c in range(len(_TABLE_HEADERS))]
+    lines = [
+        "  ".join(cell.rjust(w) if c in _RIGHT_ALIGNED else cell.ljust(w) for c, (cell, w) in enumerate(zip(r, widths))).rstrip()
+        for r in rows
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def render_items_table(items: List[Dict[str, Any]], plain: bool = False):
+    if plain:
+        render_items_plain(items)
+        return
     table = Table(title="Vinted items")
     table.add_column("#", style="cyan", justify="right")
     table.add_column("ID", style="green")
@@ -101,14 +298,11 @@ def render_items_table(items: List[Dict[str, Any]]):
     table.add_column("Favs", justify="right")
     table.add_column("Views", justify="right")
 
-    for idx, it in enumerate(items, 1):
-        amount, curr = _extract_price_currency(it)
-        price = f"{amount} {curr}".strip() if amount is not None else ""
-        title = it.get('title') or it.get('brand_title') or ''
-        days = _days_since_created(it)
-        favs = it.get('favorite_count') or it.get('favourite_count') or it.get('favorites_count') or it.get('favourites_count') or 0
-        views = it.get('view_count') or it.get('views') or 0
-        table.add_row(str(idx), str(it.get('id')), str(title), str(price), str(days), str(favs), str(views))
+    # Build every row's strings first; Rich has no add_rows, so only the bound add_row remains per row
+    rows = [_row_cells(idx, it) for idx, it in enumerate(items, 1)]
+    add_row = table.add_row
+    for r in rows:
+        add_row(*r)
     print(table)
 
 
@@ -126,6 +320,7 @@ def main():
     parser.add_argument("--login-browser", action="store_true", help="Open a browser for Vinted login and reuse extracted cookies.")
     parser.add_argument("--login-timeout", type=int, default=180, help="Seconds to wait for login to complete in browser mode (0 for no timeout).")
     parser.add_argument("--keep-login-browser", action="store_true", help="Keep the login browser window open after cookies are captured.")
+    parser.add_argument("--plain", action=argparse.BooleanOptionalAction, default=None, help="Print the item list as plain text instead of a Rich table (default when stdout is not a terminal).")
     args = parser.parse_args()
 
     if args.curl_file:
@@ -161,46 +356,15 @@ def main():
         print("[red]Could not determine user_id from cookies/JWT. Ensure v_uid or access_token_web present.[/red]")
         sys.exit(1)
 
-    # Fetch all pages and then sort by oldest
-    items = client.wardrobe_items_all(user_id, per_page=args.per_page, order="relevance")
-    if not items:
+    # Fetch all pages, then enrich each item with favorites, views, and created_at using the
+    # item/details endpoints if missing
+    enriched = asyncio.run(_load_items(client, user_id, args.per_page, cookies))
+    if not enriched:
         print("[yellow]No items found or request blocked.[/yellow]")
         sys.exit(0)
 
-    # Enrich each item with favorites, views, and created_at using the item/details endpoints if missing
-    csrf_list = None
-    try:
-        csrf_list = extract_csrf(cookies)
-    except Exception:
-        csrf_list = None
-    enriched = []
-    for it in items:
-        need_stats = not any(k in it for k in ("favorite_count", "favourite_count", "view_count", "views"))
-        need_created = not any(k in it for k in ("created_at", "created_at_ts"))
-        if need_stats or need_created:
-            try:
-                det = client.get_item(int(it.get('id')))
-                if isinstance(det, dict):
-                    # Merge non-empty stats into the item
-                    for k in ("favorite_count", "favourite_count", "view_count", "views", "created_at", "created_at_ts"):
-                        if det.get(k) is not None:
-                            it[k] = det.get(k)
-            except Exception:
-                pass
-        # If still missing created date, try editor details (requires CSRF)
-        if not any(k in it for k in ("created_at", "created_at_ts")) and csrf_list:
-            try:
-                ed = client.get_item_upload_details(int(it.get('id')), csrf_list)
-                if isinstance(ed, dict):
-                    # Prefer nested item.created_at
-                    created_nested = (ed.get('item') or {}).get('created_at')
-                    if created_nested and 'created_at' not in it:
-                        it['created_at'] = created_nested
-                    if 'created_at_ts' in ed and ed.get('created_at_ts') is not None:
-                        it['created_at_ts'] = ed.get('created_at_ts')
-            except Exception:
-                pass
-        enriched.append(it)
+    for it in enriched:
+        _display_fields(it)
 
     # Sort by oldest first using parsed creation date; unknown dates go last
     def _sort_key(x: Dict[str, Any]):
@@ -209,7 +373,8 @@ def main():
 
     enriched.sort(key=_sort_key)
 
-    render_items_table(enriched)
+    plain = args.plain if args.plain is not None else not sys.stdout.isatty()
+    render_items_table(enriched, plain=plain)
 
     idx_raw = input("Select an item number to repost (or blank to exit): ").strip()
     if not idx_raw:
@@ -250,6 +415,9 @@ def main():
                 print("[yellow]Browser automation did not confirm save. Falling back to API path...[/yellow]")
         except Exception as e:
             print(f"[yellow]Browser mode failed: {e}. Falling back to API path...[/yellow]")
+        finally:
+            # One repost per run: don't keep the pooled Chrome open through the API path and prompts
+            BrowserPool.shutdown_all()
 
     # Extract CSRF using browser if available, otherwise requests fallback
     csrf = extract_csrf(cookies)
@@ -275,7 +443,7 @@ def main():
                 price_val = float(amount) if amount is not None else None
             except Exception:
                 price_val = None
-        elif isinstance(p, (int, float)):
+        elif isinstance(p, _NUM):
             price_val = p
     currency = src.get('price_currency') or src.get('currency')
     if currency is None and isinstance(src.get('price'), dict):
@@ -294,43 +462,9 @@ def main():
     elif isinstance(src.get('photos'), list):
         photos = src['photos']
 
-    def _extract_url(p):
-        if not isinstance(p, dict):
-            return None
-        return p.get('full_size_url') or p.get('url') or p.get('image_url') or (
-            isinstance(p.get('formats'), dict) and next((v.get('url') for k, v in p['formats'].items() if isinstance(v, dict) and v.get('url')), None)
-        )
-
-    # Download to tmp and upload via API
+    # Download into memory and upload via API; photos are processed concurrently, order kept
     if photos:
-        import requests
-        tmpdir = tempfile.mkdtemp(prefix="vinted_upload_")
-        for i, p in enumerate(photos):
-            u = _extract_url(p)
-            if not u:
-                continue
-            try:
-                # Reuse the client's session to preserve cookies as-is
-                s = client.session
-                r = s.get(u, timeout=20)
-                r.raise_for_status()
-                fname = os.path.join(tmpdir, f"img_{i+1}.jpg")
-                with open(fname, 'wb') as f:
-                    f.write(r.content)
-                try:
-                    up = client.upload_photo(csrf, fname, upload_temp_uuid, photo_type='item')
-                except requests.exceptions.HTTPError as e2:
-                    body = getattr(e2.response, 'text', '') if hasattr(e2, 'response') else ''
-                    print(f"[yellow]Upload attempt failed for {fname}: {e2} {body}[/yellow]")
-                    continue
-                except Exception as e2:
-                    print(f"[yellow]Upload attempt failed for {fname}: {e2}[/yellow]")
-                    continue
-                pid = up.get('id')
-                if pid:
-                    assigned_photos.append({"id": pid, "orientation": up.get('orientation') or 0})
-            except Exception as e:
-                print(f"[yellow]Photo upload failed for {u}: {e}[/yellow]")
+        assigned_photos.extend(asyncio.run(_rehost_photos(client, csrf, photos, upload_temp_uuid)))
 
     # Build payload for direct item creation
     item_payload = {
@@ -1,10 +1,114 @@
-import re
+import shlex
 from typing import Dict, Tuple
 from urllib.parse import urlparse
 
 CookieMap = Dict[str, str]
 HeaderMap = Dict[str, str]
 
+_HEADER_FLAGS = {'-H', '--header'}
+_COOKIE_FLAGS = {'-b', '--cookie'}
+
+
+def split_cookies(raw: str, cookies: CookieMap, override: bool = True) -> None:
+    """Merge 'a=b; c=d' pairs from a cookie string into cookies, keeping values verbatim.
+
+    Values are not unquoted or unescaped, so they are sent back exactly as the browser sent them.
+    """
+    for part in raw.split(';'):
+        name, sep, val = part.partition('=')
+        if not sep:
+            continue
+        name = name.strip()
+        if override:
+            cookies[name] = val.strip()
+        else:
+            cookies.setdefault(name, val.strip())
+
+
+# Single-character escapes understood inside bash $'...' strings
+_ANSI_C_ESCAPES = {
+    'a': '\a', 'b': '\b', 'e': '\x1b', 'E': '\x1b', 'f': '\f', 'n': '\n', 'r': '\r',
+    't': '\t', 'v': '\v', '\\': '\\', "'": "'", '"': '"', '?': '?',
+}
+_HEX = set('0123456789abcdefABCDEF')
+_OCT = set('01234567')
+
+
+def _decode_ansi_c(body: str) -> str:
+    """Decode the contents of a bash $'...' string (what Chrome emits for values with ' or non-ASCII)."""
+    out = bytearray()
+    i = 0
+    n = len(body)
+    while i < n:
+        ch = body[i]
+        i += 1
+        if ch != '\\' or i >= n:
+            out += ch.encode('utf-8')
+            continue
+        esc = body[i]
+        i += 1
+        if esc in _ANSI_C_ESCAPES:
+            out += _ANSI_C_ESCAPES[esc].encode('utf-8')
+        elif esc in 'xuU':
+            width = {'x': 2, 'u': 4, 'U': 8}[esc]
+            j = i
+            while j < n and j - i < width and body[j] in _HEX:
+                j += 1
+            if j == i:
+                out += ('\\' + esc).encode('utf-8')
+                continue
+            code = int(body[i:j], 16)
+            # \xHH is a raw byte (UTF-8 sequences are spelled out byte by byte); \u is a code point
+            out += bytes([code]) if esc == 'x' else chr(code).encode('utf-8', 'surrogatepass')
+            i = j
+        elif esc in _OCT:
+            j = i
+            while j < n and j - i < 2 and body[j] in _OCT:
+                j += 1
+            out.append(int(esc + body[i:j], 8) & 0xFF)
+            i = j
+        else:
+            out += ('\\' + esc).encode('utf-8')
+    return out.decode('utf-8', 'replace')
+
+
+def _expand_ansi_c_quotes(text: str) -> str:
+    """Rewrite bash $'...' strings as plain shell quoting, which shlex does not understand."""
+    if "$'" not in text:
+        return text
+    out = []
+    quote = None
+    i = 0
+    n = len(text)
+    while i < n:
+        ch = text[i]
+        if quote:
+            if ch == '\\' and quote == '"' and i + 1 < n:
+                out.append(text[i:i + 2])
+                i += 2
+                continue
+            if ch == quote:
+                quote = None
+            out.append(ch)
+            i += 1
+        elif ch == '\\' and i + 1 < n:
+            out.append(text[i:i + 2])
+            i += 2
+        elif ch in '\'"':
+            quote = ch
+            out.append(ch)
+            i += 1
+        elif ch == '$' and text.startswith("$'", i):
+            j = i + 2
+            while j < n and text[j] != "'":
+                j += 2 if text[j] == '\\' else 1
+            out.append(shlex.quote(_decode_ansi_c(text[i + 2:j])))
+            i = j + 1
+        else:
+            out.append(ch)
+            i += 1
+    return ''.join(out)
+
 
 def parse_curl(curl_text: str) -> Tuple[str, HeaderMap, CookieMap, str]:
     """
@@ -12,43 +116,45 @@ def parse_curl(curl_text: str) -> Tuple[str, HeaderMap, CookieMap, str]:
 
     Returns: (url, headers, cookies, user_agent)
     """
-    # Collapse line continuations and normalize whitespace
-    text = re.sub(r"\\\s*\\\n\s*", " ", curl_text.strip())
-    text = re.sub(r"\s+\\\n", " ", text)
+    # One shell-style tokenization pass; quoting and escapes are handled by shlex
+    tokens = shlex.split(_expand_ansi_c_quotes(curl_text.strip()))
 
-    # URL
-    m_url = re.search(r"curl\s+'([^']+)'|curl\s+\"([^\"]+)\"|curl\s+([^\s]+)", text)
-    if not m_url:
+    url = None
+    headers: HeaderMap = {}
+    cookie_arg = None
+    i = 0
+    n = len(tokens)
+    while i < n:
+        tok = tokens[i]
+        i += 1
+        # Escaped line continuations come through as bare newline tokens
+        if not tok.strip():
+            continue
+        if tok in _HEADER_FLAGS and i < n:
+            k, _, v = tokens[i].partition(':')
+            i += 1
+            headers[k.strip().casefold()] = v.strip()
+        elif tok in _COOKIE_FLAGS and i < n:
+            # Only the first -b is used, like the browser exports
+            if cookie_arg is None:
+                cookie_arg = tokens[i]
+            i += 1
+        elif url is None and tok.startswith('http'):
+            url = tok
+
+    if not url:
         raise ValueError("Could not find URL in curl text")
-    url = next(g for g in m_url.groups() if g)
     urlparse(url)  # validates
 
-    # Headers (-H 'k: v')
-    headers: HeaderMap = {}
-    for k, v in re.findall(r"-H\s+'([^:]+):\s*([^']*)'", text):
-        headers[k.strip().lower()] = v.strip()
-
     # Cookies (-b 'a=b; c=d') and/or -H 'cookie: ...'
     cookies: CookieMap = {}
-    b_match = re.search(r"-b\s+'([^']+)'|-b\s+\"([^\"]+)\"", text)
-    if b_match:
-        raw = next(g for g in b_match.groups() if g)
-        for part in raw.split(';'):
-            if '=' in part:
-                name, val = part.split('=', 1)
-                cookies[name.strip()] = val.strip()
+    if cookie_arg:
+        split_cookies(cookie_arg, cookies)
 
     # Also merge cookies from a Cookie header if present
-    cookie_hdr = None
-    for hk, hv in headers.items():
-        if hk.lower() == 'cookie':
-            cookie_hdr = hv
-            break
+    cookie_hdr = headers.get('cookie')
     if cookie_hdr:
-        for part in cookie_hdr.split(';'):
-            if '=' in part:
-                name, val = part.split('=', 1)
-                cookies.setdefault(name.strip(), val.strip())
+        split_cookies(cookie_hdr, cookies, override=False)
 
     user_agent = headers.get('user-agent', '')
     return url, headers, cookies, user_agent
@@ -1,21 +1,101 @@
+import asyncio
 import base64
+import io
 import json
+import os
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import IO, Any, Dict, List, Optional, Tuple
 
 try:
-    import jwt  # pyjwt
+    import orjson  # type: ignore
 except Exception:
-    jwt = None  # type: ignore
+    orjson = None  # type: ignore
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ._http import HTTP2_AVAILABLE
 
 Json = Dict[str, Any]
 
+# Photo files are always images we name ourselves; avoids mimetypes' lazy system-table load
+_EXT_MIME = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.webp': 'image/webp',
+}
+
+# Concurrent wardrobe page fetches; kept low to stay under Vinted's rate limiting (429)
+WARDROBE_PAGE_WORKERS = 8
+
+# Throttling and transient server errors worth retrying on idempotent GETs
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+GET_RETRIES = 3
+
+
+def _json(r) -> Any:
+    """Decode a response body, using orjson when installed."""
+    return orjson.loads(r.content) if orjson else r.json()
+
+
+def _dumps(payload: Any) -> bytes:
+    """Encode a JSON request body; callers set the content-type header themselves."""
+    return orjson.dumps(payload) if orjson else json.dumps(payload).encode()
+
+
+def _retry_after(r: httpx.Response) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date), if present."""
+    value = r.headers.get('retry-after')
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def _photo_form(filename: str, fileobj: Any, temp_uuid: str, photo_type: str) -> Tuple[Json, Json]:
+    """Multipart fields for POST /api/v2/photos as (files, data)."""
+    mime = _EXT_MIME.get(os.path.splitext(filename)[1].lower(), 'application/octet-stream')
+    files = {
+        'photo[file]': (filename, fileobj, mime),
+    }
+    data = {
+        'photo[type]': photo_type,
+        'photo[temp_uuid]': temp_uuid,
+    }
+    return files, data
+
 
 class VintedClient:
     def __init__(self, base_url: str = "https://www.vinted.fr", headers: Optional[Dict[str, str]] = None, cookies: Optional[Dict[str, str]] = None):
         self.base_url = base_url.rstrip('/')
         self.session = requests.Session()
+        # Pool sized for the concurrent page/photo fetches, with backoff on throttling and 5xx.
+        # Only GETs are retried: a retried POST could create a duplicate item or photo.
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=GET_RETRIES,
+                backoff_factor=0.5,
+                status_forcelist=_RETRY_STATUSES,
+                allowed_methods=frozenset(['GET']),
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount('https://', adapter)
         self.session.headers.update({
             'accept': 'application/json, text/plain, */*',
         })
@@ -28,6 +108,35 @@ class VintedClient:
         if cookies:
             for k, v in cookies.items():
                 self.session.cookies.set(k, v, domain=".vinted.fr")
+        self._anon_id: Optional[str] = None
+        self._refresh_anon_id()
+
+    def _refresh_anon_id(self) -> None:
+        # Resolved once for the upload/create headers; the last match wins when anon_id is
+        # duplicated across domains (iterating avoids CookieConflictError)
+        for c in self.session.cookies:
+            if c.name == 'anon_id' and c.value:
+                self._anon_id = c.value
+
+    def async_client(self, max_connections: int = 16) -> httpx.AsyncClient:
+        """Build an httpx.AsyncClient with this session's headers and cookies for concurrent requests.
+
+        The caller owns the client and must close it (use it as an async context manager).
+        """
+        # Let httpx manage connection-level headers itself
+        headers = {k: v for k, v in self.session.headers.items() if k.lower() not in {
+            'connection', 'accept-encoding'
+        }}
+        jar = httpx.Cookies()
+        for c in self.session.cookies:
+            jar.set(c.name, c.value, domain=c.domain, path=c.path)
+        return httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=20,
+            headers=headers,
+            cookies=jar,
+            limits=httpx.Limits(max_connections=max_connections),
+        )
 
     def get_user_id(self) -> Optional[int]:
         # Prefer v_uid cookie
@@ -36,9 +145,11 @@ class VintedClient:
             return int(v_uid)
         # Fallback: parse access_token_web JWT 'sub'
         token = self.session.cookies.get('access_token_web')
-        if token and jwt:
+        if token:
             try:
-                payload = jwt.decode(token, options={"verify_signature": False, "verify_aud": False})
+                # Only the unverified payload segment is needed; decode it directly
+                seg = token.split('.')[1]
+                payload = json.loads(base64.urlsafe_b64decode(seg + '=' * (-len(seg) % 4)))
                 sub = payload.get('sub')
                 if sub and str(sub).isdigit():
                     return int(sub)
@@ -51,7 +162,7 @@ class VintedClient:
         params = {"page": page, "per_page": per_page, "order": "relevance"}
         r = self.session.get(url, params=params)
         r.raise_for_status()
-        data = r.json()
+        data = _json(r)
         # API usually returns {items: [...]} or {catalog_items: [...]}
         return data.get('items') or data.get('catalog_items') or []
 
@@ -61,7 +172,7 @@ class VintedClient:
         params = {"page": page, "per_page": per_page, "order": order}
         r = self.session.get(url, params=params)
         r.raise_for_status()
-        data = r.json()
+        data = _json(r)
         items = data.get('items') or data.get('catalog_items') or []
         pagination = data.get('pagination') or {}
         return items, pagination
@@ -92,7 +203,7 @@ class VintedClient:
         url = f"{self.base_url}/api/v2/items/{item_id}"
         r = self.session.get(url)
         r.raise_for_status()
-        return r.json().get('item') or {}
+        return _json(r).get('item') or {}
 
     def get_item_upload_details(self, item_id: int, csrf_token: Optional[str] = None) -> Json:
         """Fetch rich item details from the item_upload namespace used by the editor.
@@ -101,15 +212,9 @@ class VintedClient:
         GET /api/v2/item_upload/items/{id}
         """
         url = f"{self.base_url}/api/v2/item_upload/items/{item_id}"
-        headers = {
-            'x-enable-multiple-size-groups': 'true',
-            'referer': f"{self.base_url}/items/{item_id}/edit",
-        }
-        if csrf_token:
-            headers['x-csrf-token'] = csrf_token
-        r = self.session.get(url, headers=headers)
+        r = self.session.get(url, headers=self._editor_headers(item_id, csrf_token))
         r.raise_for_status()
-        return r.json()
+        return _json(r)
 
     def create_draft(self, csrf_token: str, payload: Json) -> Json:
         url = f"{self.base_url}/api/v2/item_upload/drafts"
@@ -120,47 +225,49 @@ class VintedClient:
             'origin': self.base_url,
             'referer': f"{self.base_url}/items/new",
         }
-        r = self.session.post(url, json=payload, headers=headers)
+        r = self.session.post(url, data=_dumps(payload), headers=headers)
         r.raise_for_status()
-        return r.json()
+        return _json(r)
 
     def upload_photo(self, csrf_token: str, file_path: str, temp_uuid: str, photo_type: str = 'item') -> Json:
         """Upload a single photo file to Vinted and return the JSON response with photo id.
 
         This mirrors the browser request to POST /api/v2/photos using multipart/form-data.
         """
-        import mimetypes
+        with open(file_path, 'rb') as f:
+            return self._post_photo(csrf_token, file_path.split('/')[-1], f, temp_uuid, photo_type)
+
+    def upload_photo_bytes(self, csrf_token: str, data: bytes, filename: str, temp_uuid: str, photo_type: str = 'item') -> Json:
+        """Same as upload_photo, for an image already held in memory (no temp file)."""
+        return self._post_photo(csrf_token, filename, io.BytesIO(data), temp_uuid, photo_type)
+
+    def _post_photo(self, csrf_token: str, filename: str, fileobj: IO[bytes], temp_uuid: str, photo_type: str) -> Json:
         url = f"{self.base_url}/api/v2/photos"
-        # Build headers; DO NOT set Content-Type manually, requests will set proper boundary
+        files, data = _photo_form(filename, fileobj, temp_uuid, photo_type)
+        r = self.session.post(url, headers=self._photo_headers(csrf_token), files=files, data=data)
+        r.raise_for_status()
+        return _json(r)
+
+    def _editor_headers(self, item_id: int, csrf_token: Optional[str]) -> Dict[str, str]:
+        headers = {
+            'x-enable-multiple-size-groups': 'true',
+            'referer': f"{self.base_url}/items/{item_id}/edit",
+        }
+        if csrf_token:
+            headers['x-csrf-token'] = csrf_token
+        return headers
+
+    def _photo_headers(self, csrf_token: str) -> Dict[str, str]:
+        # DO NOT set Content-Type manually, the HTTP client sets the multipart boundary
         headers = {
             'accept': 'application/json, text/plain, */*',
             'origin': self.base_url,
             'referer': f"{self.base_url}/items/new",
             'x-csrf-token': csrf_token,
         }
-        # Optionally include x-anon-id from a single matching cookie; otherwise skip
-        try:
-            # Iterate to avoid CookieConflictError when duplicates exist
-            anon_vals = [c.value for c in self.session.cookies if c.name == 'anon_id']
-            anon = anon_vals[-1] if anon_vals else None
-            if anon:
-                headers['x-anon-id'] = anon
-        except Exception:
-            pass
-
-        mime, _ = mimetypes.guess_type(file_path)
-        mime = mime or 'application/octet-stream'
-        with open(file_path, 'rb') as f:
-            files = {
-                'photo[file]': (file_path.split('/')[-1], f, mime),
-            }
-            data = {
-                'photo[type]': photo_type,
-                'photo[temp_uuid]': temp_uuid,
-            }
-            r = self.session.post(url, headers=headers, files=files, data=data)
-            r.raise_for_status()
-            return r.json()
+        if self._anon_id:
+            headers['x-anon-id'] = self._anon_id
+        return headers
 
     def publish_draft(self, csrf_token: str, draft_id: int, draft_payload: Json) -> Json:
         """Publish a draft by completing it.
@@ -176,9 +283,9 @@ class VintedClient:
             'origin': self.base_url,
             'referer': f"{self.base_url}/items/{draft_id}/edit",
         }
-        r = self.session.post(url, json=draft_payload, headers=headers)
+        r = self.session.post(url, data=_dumps(draft_payload), headers=headers)
         r.raise_for_status()
-        return r.json()
+        return _json(r)
 
     def delete_item(self, csrf_token: str, item_id: int) -> Json:
         """Delete an existing item before publishing the reposted one.
@@ -195,7 +302,7 @@ class VintedClient:
         r = self.session.post(url, headers=headers)
         r.raise_for_status()
         try:
-            return r.json()
+            return _json(r)
         except Exception:
             return {"ok": True}
 
@@ -214,15 +321,106 @@ class VintedClient:
             'origin': self.base_url,
             'referer': f"{self.base_url}/items/new",
         }
-        # Optionally include anon id
+        if self._anon_id:
+            headers['x-anon-id'] = self._anon_id
+
+        r = self.session.post(url, data=_dumps(payload), headers=headers)
+        r.raise_for_status()
+        return _json(r)
+
+
+class AsyncVintedClient:
+    """Async counterpart of VintedClient for the fan-out stages (wardrobe paging, enrichment, photo re-hosting).
+
+    All requests go through one httpx.AsyncClient, so they share a connection pool (a single
+    multiplexed HTTP/2 connection when h2 is installed). Use it as an async context manager.
+    """
+
+    def __init__(self, client: VintedClient, max_connections: int = 16):
+        self._sync = client
+        self.base_url = client.base_url
+        self._cli = client.async_client(max_connections=max_connections)
+
+    async def __aenter__(self) -> 'AsyncVintedClient':
+        return self
+
+    async def __aexit__(self, *exc) -> None:
         try:
-            anon_vals = [c.value for c in self.session.cookies if c.name == 'anon_id']
-            anon = anon_vals[-1] if anon_vals else None
-            if anon:
-                headers['x-anon-id'] = anon
-        except Exception:
-            pass
+            # Carry cookies rotated by Set-Cookie (datadome, access_token_web) back to the sync
+            # session so later API calls send them
+            for c in self._cli.cookies.jar:
+                self._sync.session.cookies.set_cookie(c)
+            self._sync._refresh_anon_id()
+        finally:
+            await self._cli.aclose()
+
+    async def _get(self, url: str, **kwargs) -> httpx.Response:
+        # Same policy as the sync session's Retry: back off on throttling and 5xx (honouring
+        # Retry-After), GETs only
+        for attempt in range(GET_RETRIES + 1):
+            r = await self._cli.get(url, **kwargs)
+            if r.status_code not in _RETRY_STATUSES or attempt == GET_RETRIES:
+                break
+            delay = _retry_after(r)
+            await asyncio.sleep(0.5 * 2 ** attempt if delay is None else delay)
+        r.raise_for_status()
+        return r
+
+    async def fetch_bytes(self, url: str) -> bytes:
+        """Download a raw resource (e.g. a photo from the CDN) through the shared pool."""
+        return (await self._get(url)).content
+
+    async def wardrobe_items_page(self, user_id: int, page: int = 1, per_page: int = 20, order: str = "relevance") -> Tuple[List[Json], Dict[str, Any]]:
+        """Fetch a single wardrobe page and return (items, pagination)."""
+        url = f"{self.base_url}/api/v2/wardrobe/{user_id}/items"
+        params = {"page": page, "per_page": per_page, "order": order}
+        data = _json(await self._get(url, params=params))
+        items = data.get('items') or data.get('catalog_items') or []
+        pagination = data.get('pagination') or {}
+        return items, pagination
+
+    async def wardrobe_items_all(self, user_id: int, per_page: int = 20, order: str = "relevance", max_pages: Optional[int] = None) -> List[Json]:
+        """Same as VintedClient.wardrobe_items_all, with pages 2..N gathered on the event loop."""
+        items, pagination = await self.wardrobe_items_page(user_id, page=1, per_page=per_page, order=order)
+        items_all: List[Json] = list(items)
+        total_pages = pagination.get('total_pages') if isinstance(pagination, dict) else None
+        if max_pages is not None and max_pages <= 1:
+            return items_all
+        if isinstance(total_pages, int):
+            last = total_pages if max_pages is None else min(total_pages, max_pages)
+            sem = asyncio.Semaphore(WARDROBE_PAGE_WORKERS)
+
+            async def _page(p: int) -> List[Json]:
+                async with sem:
+                    page_items, _ = await self.wardrobe_items_page(user_id, page=p, per_page=per_page, order=order)
+                    return page_items
+
+            for page_items in await asyncio.gather(*[_page(p) for p in range(2, last + 1)]):
+                items_all.extend(page_items)
+            return items_all
+        # Pagination missing: walk pages until one comes back short
+        page = 1
+        while items and len(items) >= per_page:
+            if max_pages is not None and page >= max_pages:
+                break
+            page += 1
+            items, _ = await self.wardrobe_items_page(user_id, page=page, per_page=per_page, order=order)
+            items_all.extend(items)
+        return items_all
 
-        r = self.session.post(url, json=payload, headers=headers)
+    async def get_item(self, item_id: int) -> Json:
+        r = await self._get(f"{self.base_url}/api/v2/items/{item_id}")
+        return _json(r).get('item') or {}
+
+    async def get_item_upload_details(self, item_id: int, csrf_token: Optional[str] = None) -> Json:
+        url = f"{self.base_url}/api/v2/item_upload/items/{item_id}"
+        r = await self._get(url, headers=self._sync._editor_headers(item_id, csrf_token))
+        return _json(r)
+
+    async def upload_photo_bytes(self, csrf_token: str, data: bytes, filename: str, temp_uuid: str, photo_type: str = 'item') -> Json:
+        """Upload an in-memory photo; never retried, a repeated POST would attach a duplicate."""
+        url = f"{self.base_url}/api/v2/photos"
+        files, form = _photo_form(filename, data, temp_uuid, photo_type)
+        r = await self._cli.post(url, headers=self._sync._photo_headers(csrf_token), files=files, data=form)
         r.raise_for_status()
-        return r.json()
+        return _json(r)